@@ -10,20 +10,40 @@ class Node:
         self.left = None
         self.right = None
         self.parent = None
+        self.deleted = False  # Tombstone flag used in lazy delete mode
 
 
 class RedBlackTree:
-    """Red-Black Tree with insert, search, delete, and serialization."""
+    """Red-Black Tree with insert, search, delete, and serialization.
 
-    def __init__(self):
+    With tombstones=True, delete only marks the node as deleted and the tree
+    is rebuilt by compact() once tombstones make up half of its nodes.
+    """
+
+    def __init__(self, tombstones=False):
         self.NIL = Node(None, Node.BLACK)  # Sentinel NIL node (Black)
         self.NIL.left = self.NIL
         self.NIL.right = self.NIL
         self.NIL.parent = None
         self.root = self.NIL
+        self.tombstones = tombstones
+        self.node_count = 0  # Nodes in the tree, tombstones included
+        self.tombstone_count = 0
+
+    def __len__(self):
+        """Number of live keys in the tree."""
+        return self.node_count - self.tombstone_count
 
     def insert(self, key):
         """Inserts a node while maintaining Red-Black properties."""
+        # Revive a tombstone with the same key instead of adding a new node
+        if self.tombstone_count:
+            node = self._find_equal(self.root, key, True)
+            if node is not None:
+                node.deleted = False
+                self.tombstone_count -= 1
+                return
+
         # Step 1: Standard BST insert
         new_node = Node(key)
         new_node.left = self.NIL
@@ -50,6 +70,7 @@ class RedBlackTree:
             y.left = new_node
         else:
             y.right = new_node
+        self.node_count += 1
         
         # Step 2: Fix Red-Black properties
         self._fix_insert(new_node)
@@ -59,6 +80,8 @@ class RedBlackTree:
         current = self.root
         while current != self.NIL:
             if key == current.key:
+                if current.deleted:
+                    return self._find_equal(current, key, False)
                 return current
             elif key < current.key:
                 current = current.left
@@ -73,6 +96,60 @@ class RedBlackTree:
         if z is None:
             return  # Key not found
         
+        if self.tombstones:
+            # Lazy mode: mark the node and rebuild once tombstones dominate
+            z.deleted = True
+            self.tombstone_count += 1
+            if self.tombstone_count * 2 >= self.node_count:
+                self.compact()
+            return
+        
+        self._delete_node(z)
+        self.node_count -= 1
+    
+    def delete_range(self, lo, hi):
+        """Delete all nodes with lo <= key <= hi, returns the number of keys removed.
+        
+        The tree is split around the range and the outer parts are joined back,
+        so the cost is O(log n) plus counting the k removed nodes.
+        """
+        if self.root == self.NIL or hi < lo:
+            return 0
+        
+        left, left_bh, rest, rest_bh = self._split(self.root, self._root_black_height(self.root), lo, False)
+        middle, _, right, _ = self._split(rest, rest_bh, hi, True)
+        
+        removed, removed_tombstones = self._count_nodes(middle)
+        self.node_count -= removed
+        self.tombstone_count -= removed_tombstones
+        
+        self.root = self._concat(left, left_bh, right)
+        return removed - removed_tombstones
+    
+    def compact(self):
+        """Drop tombstones and rebuild a balanced tree from the live nodes in O(n)."""
+        # In-order traversal collects live nodes already sorted
+        nodes = []
+        stack = []
+        current = self.root
+        while stack or current != self.NIL:
+            while current != self.NIL:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            if not current.deleted:
+                nodes.append(current)
+            current = current.right
+        
+        self.node_count = len(nodes)
+        self.tombstone_count = 0
+        
+        # Only the deepest level can be incomplete, colour it red
+        self.root = self._build(nodes, 0, len(nodes), 0, len(nodes).bit_length() - 1)
+        self.root.parent = None
+    
+    def _delete_node(self, z):
+        """Unlink node z from the tree and restore Red-Black properties."""
         y = z  # y will be the node to be removed from the tree
         y_original_color = y.color
         
@@ -163,7 +240,7 @@ class RedBlackTree:
         x.parent = y
     
     def _fix_insert(self, k):
-        """Fix Red-Black properties after insertion."""
+        """Fix Red-Black properties after insertion, returns True if black height grew."""
         # While we have a red-red conflict
         while k != self.root and k.parent and k.parent.color == Node.RED:
             if k.parent == k.parent.parent.right:  # Parent is right child of grandparent
@@ -205,8 +282,10 @@ class RedBlackTree:
                     k.parent.parent.color = Node.RED
                     self._right_rotate(k.parent.parent)
         
-        # Ensure root is black
+        # Ensure root is black, report whether this added a black level
+        grew = self.root.color == Node.RED
         self.root.color = Node.BLACK
+        return grew
     
     def _fix_delete(self, x):
         """Fix Red-Black properties after deletion."""
@@ -288,6 +367,174 @@ class RedBlackTree:
             current = current.left
         return current
     
+    def _find_equal(self, node, key, deleted):
+        """Find a node with the given key and tombstone state in the subtree rooted at node."""
+        current = node
+        while current != self.NIL:
+            if key < current.key:
+                current = current.left
+            elif current.key < key:
+                current = current.right
+            elif current.deleted == deleted:
+                return current
+            else:
+                # Duplicates can sit on either side after rotations
+                found = self._find_equal(current.left, key, deleted)
+                if found is None:
+                    found = self._find_equal(current.right, key, deleted)
+                return found
+        return None
+    
+    def _root_black_height(self, node):
+        """Count black nodes on the left spine of a subtree, NIL excluded."""
+        height = 0
+        while node != self.NIL:
+            if node.color == Node.BLACK:
+                height += 1
+            node = node.left
+        return height
+    
+    def _count_nodes(self, node):
+        """Count nodes and tombstones in the subtree rooted at node."""
+        count = 0
+        tombstones = 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current == self.NIL:
+                continue
+            count += 1
+            if current.deleted:
+                tombstones += 1
+            stack.append(current.left)
+            stack.append(current.right)
+        return count, tombstones
+    
+    def _build(self, nodes, lo, hi, depth, max_depth):
+        """Build a balanced subtree from sorted nodes[lo:hi]."""
+        if lo >= hi:
+            return self.NIL
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._build(nodes, lo, mid, depth + 1, max_depth)
+        node.right = self._build(nodes, mid + 1, hi, depth + 1, max_depth)
+        if node.left != self.NIL:
+            node.left.parent = node
+        if node.right != self.NIL:
+            node.right.parent = node
+        node.color = Node.RED if depth == max_depth and depth > 0 else Node.BLACK
+        return node
+    
+    def _join(self, left, left_bh, pivot, right, right_bh):
+        """Join two detached subtrees around pivot, where left <= pivot <= right.
+        
+        left_bh and right_bh are the black heights of the subtrees. Returns the
+        new subtree root and its black height. Runs in O(|left_bh - right_bh| + 1).
+        """
+        # Work with black roots so black heights line up
+        if left.color == Node.RED:
+            left.color = Node.BLACK
+            left_bh += 1
+        if right.color == Node.RED:
+            right.color = Node.BLACK
+            right_bh += 1
+        
+        if left_bh == right_bh:
+            # Case 1: Equal black heights - pivot becomes a black root
+            pivot.left = left
+            pivot.right = right
+            pivot.parent = None
+            pivot.color = Node.BLACK
+            if left != self.NIL:
+                left.parent = pivot
+            if right != self.NIL:
+                right.parent = pivot
+            return pivot, left_bh + 1
+        
+        if left_bh > right_bh:
+            # Case 2: Left is taller - hang pivot off its right spine
+            c = left
+            height = left_bh
+            parent = None
+            while c.color == Node.RED or height > right_bh:
+                if c.color == Node.BLACK:
+                    height -= 1
+                parent = c
+                c = c.right
+            parent.right = pivot
+            pivot.left = c
+            pivot.right = right
+            self.root = left
+        else:
+            # Case 3: Right is taller - hang pivot off its left spine
+            c = right
+            height = right_bh
+            parent = None
+            while c.color == Node.RED or height > left_bh:
+                if c.color == Node.BLACK:
+                    height -= 1
+                parent = c
+                c = c.left
+            parent.left = pivot
+            pivot.left = left
+            pivot.right = c
+            self.root = right
+        
+        pivot.parent = parent
+        pivot.color = Node.RED
+        if pivot.left != self.NIL:
+            pivot.left.parent = pivot
+        if pivot.right != self.NIL:
+            pivot.right.parent = pivot
+        
+        # Pivot is now a red node with equal black heights below, fix like an insert
+        grew = self._fix_insert(pivot)
+        return self.root, max(left_bh, right_bh) + (1 if grew else 0)
+    
+    def _split(self, node, node_bh, key, inclusive):
+        """Split a detached subtree into keys below key and the rest.
+        
+        With inclusive=True keys equal to key go to the left part. Returns
+        (left, left_bh, right, right_bh).
+        """
+        if node == self.NIL:
+            return self.NIL, 0, self.NIL, 0
+        
+        child_bh = node_bh - (1 if node.color == Node.BLACK else 0)
+        left = node.left
+        right = node.right
+        if left != self.NIL:
+            left.parent = None
+        if right != self.NIL:
+            right.parent = None
+        
+        if node.key < key or (inclusive and node.key == key):
+            # node and its left subtree go left, split the right subtree
+            right_left, right_left_bh, right_right, right_right_bh = self._split(right, child_bh, key, inclusive)
+            joined, joined_bh = self._join(left, child_bh, node, right_left, right_left_bh)
+            return joined, joined_bh, right_right, right_right_bh
+        
+        # node and its right subtree go right, split the left subtree
+        left_left, left_left_bh, left_right, left_right_bh = self._split(left, child_bh, key, inclusive)
+        joined, joined_bh = self._join(left_right, left_right_bh, node, right, child_bh)
+        return left_left, left_left_bh, joined, joined_bh
+    
+    def _concat(self, left, left_bh, right):
+        """Concatenate two detached subtrees where all keys in left <= keys in right."""
+        if right == self.NIL:
+            return left
+        if left == self.NIL:
+            return right
+        
+        # Borrow the minimum of right as the pivot for the join
+        pivot = self._minimum(right)
+        self.root = right
+        self._delete_node(pivot)
+        right = self.root
+        
+        root, _ = self._join(left, left_bh, pivot, right, self._root_black_height(right))
+        return root
+    
     # Additional methods for validation and debugging
     
     def height(self, node=None):
@@ -7,8 +7,8 @@ from pstats import SortKey
 
 from rbt.red_black_tree import RedBlackTree
 
-def create_tree(nums):
-    rbt = RedBlackTree()
+def create_tree(nums, tombstones=False):
+    rbt = RedBlackTree(tombstones=tombstones)
 
     for num in nums:
         rbt.insert(num)
@@ -70,6 +70,31 @@ def profile_rbt_find(size):
 
     return sum(times) / len(times)
 
+def profile_rbt_delete(size, mode):
+    data = random.sample(range(1, size * 10), size)
+    sample = random.sample(data, size)
+
+    rbt = create_tree(sample, tombstones=(mode == 'tombstone'))
+
+    # Evict a contiguous key range, as the eviction job does
+    n_tests = 10000
+    keys = sorted(data)
+    start = random.randint(0, size - n_tests)
+    victims = keys[start:start + n_tests]
+
+    pr = cProfile.Profile()
+    pr.enable()
+    if mode == 'range':
+        rbt.delete_range(victims[0], victims[-1])
+    else:
+        for key in victims:
+            rbt.delete(key)
+    if mode == 'tombstone':
+        rbt.compact()
+    pr.disable()
+
+    return get_profile_time(pr) / n_tests
+
 def test_insert_time():
     sizes = [100000 * i for i in range(1, 10)]
     times = []
@@ -116,3 +141,31 @@ def test_find_time():
     plt.show()
 
     print("Analysis complete! Check 'rbt_find_time_complexity.png' for the visualization.")
+
+
+def test_delete_time():
+    sizes = [100000 * i for i in range(1, 10)]
+    modes = ['key', 'range', 'tombstone']
+    times = {mode: [] for mode in modes}
+
+    for size in sizes:
+        for mode in modes:
+            print(f"Testing {mode} delete with size {size}")
+            time_taken = profile_rbt_delete(size, mode)
+            times[mode].append(time_taken)
+            print(f"Time taken: {time_taken:.6f} seconds")
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(sizes, times['key'], 'o-', label='Per-key delete')
+    plt.plot(sizes, times['range'], 'o-', label='delete_range')
+    plt.plot(sizes, times['tombstone'], 'o-', label='Tombstone delete + compact')
+    plt.xlabel('Input Size (n)')
+    plt.ylabel('Time per deleted key (seconds)')
+    plt.title('Red-Black Tree Delete Time Complexity')
+    plt.grid(True)
+
+    plt.legend()
+    plt.savefig('rbt_delete_time_complexity.png')
+    plt.show()
+
+    print("Analysis complete! Check 'rbt_delete_time_complexity.png' for the visualization.")
@@ -148,3 +148,84 @@ def test_validate():
     test_rbt(test_data_3, "Medium Tree (20 random elements)")
     test_rbt(test_data_4, "Big Tree (100 random elements)")
     test_rbt(test_data_5, "Big Tree (1000 random elements)")
+
+
+def test_delete_range():
+    random.seed(7)
+    data = random.sample(range(1, 1000), 200)
+
+    rbt = RedBlackTree()
+    for item in data:
+        rbt.insert(item)
+
+    expected_removed = [item for item in data if 100 <= item <= 400]
+    assert rbt.delete_range(100, 400) == len(expected_removed)
+    assert rbt.validate()
+    assert len(rbt) == len(data) - len(expected_removed)
+
+    for item in data:
+        if 100 <= item <= 400:
+            assert rbt.find(item) is None
+        else:
+            assert rbt.find(item) is not None
+
+    # Empty and out of bounds ranges remove nothing
+    assert rbt.delete_range(100, 400) == 0
+    assert rbt.delete_range(500, 499) == 0
+
+    # Whole tree
+    assert rbt.delete_range(0, 1000) == len(data) - len(expected_removed)
+    assert str(rbt) == "NIL"
+    assert len(rbt) == 0
+
+
+def test_tombstone_delete():
+    rbt = RedBlackTree(tombstones=True)
+    for item in [20, 15, 30, 10, 25, 35]:
+        rbt.insert(item)
+
+    structure = str(rbt)
+    rbt.delete(10)
+
+    # Node is only marked, the tree shape stays the same
+    assert rbt.find(10) is None
+    assert str(rbt) == structure
+    assert rbt.tombstone_count == 1
+    assert len(rbt) == 5
+
+    # Inserting the key again revives the tombstone
+    rbt.insert(10)
+    assert rbt.find(10) is not None
+    assert str(rbt) == structure
+    assert rbt.tombstone_count == 0
+
+    # Compaction kicks in once half of the nodes are tombstones
+    rbt.delete(10)
+    rbt.delete(20)
+    assert rbt.tombstone_count == 2
+    rbt.delete(25)
+    assert rbt.tombstone_count == 0
+    assert rbt.node_count == 3
+    assert str(rbt) == "30(BLACK),15(RED),NIL,NIL,35(RED),NIL,NIL"
+    assert rbt.validate()
+
+
+def test_compact():
+    random.seed(11)
+
+    for size in [1, 2, 3, 7, 8, 100, 1000]:
+        data = random.sample(range(1, size * 10 + 1), size)
+        rbt = RedBlackTree(tombstones=True)
+        for item in data:
+            rbt.insert(item)
+
+        removed = data[: size // 3]
+        for item in removed:
+            rbt.delete(item)
+        rbt.compact()
+
+        assert rbt.tombstone_count == 0
+        assert rbt.node_count == size - len(removed)
+        assert rbt.validate()
+        for item in data:
+            assert (rbt.find(item) is None) == (item in removed)